@@ -0,0 +1,737 @@
+"""Stream schemas generated by `python -m tap_gorgias.build_schemas`.
+
+Do not edit by hand, edit `tap_gorgias/build_schemas.py` instead.
+"""
+
+CUSTOMER = {
+    "type": ["object", "null"],
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "email": {
+            "type": ["string", "null"],
+        },
+        "name": {
+            "type": ["string", "null"],
+        },
+        "firstname": {
+            "type": ["string", "null"],
+        },
+        "lastname": {
+            "type": ["string", "null"],
+        },
+    },
+}
+
+TICKETS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+        "external_id": {
+            "type": ["string", "null"],
+        },
+        "language": {
+            "type": ["string", "null"],
+        },
+        "status": {
+            "type": ["string", "null"],
+        },
+        "priority": {
+            "type": ["string", "null"],
+        },
+        "channel": {
+            "type": ["string", "null"],
+        },
+        "via": {
+            "type": ["string", "null"],
+        },
+        "from_agent": {
+            "type": ["boolean", "null"],
+        },
+        "requester": CUSTOMER,
+        "customer": CUSTOMER,
+        "assignee_user": CUSTOMER,
+        "assignee_team": {
+            "type": ["object", "null"],
+            "properties": {
+                "id": {
+                    "type": ["integer", "null"],
+                },
+                "name": {
+                    "type": ["string", "null"],
+                },
+                "decoration": {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "emoji": {
+                            "type": ["object", "null"],
+                            "properties": {
+                                "id": {
+                                    "type": ["string", "null"],
+                                },
+                                "name": {
+                                    "type": ["string", "null"],
+                                },
+                                "skin": {
+                                    "type": ["integer", "null"],
+                                },
+                                "colons": {
+                                    "type": ["string", "null"],
+                                },
+                                "native": {
+                                    "type": ["string", "null"],
+                                },
+                                "unified": {
+                                    "type": ["string", "null"],
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        "subject": {
+            "type": ["string", "null"],
+        },
+        "excerpt": {
+            "type": ["string", "null"],
+        },
+        "integrations": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {
+                        "type": ["string", "null"],
+                    },
+                    "address": {
+                        "type": ["string", "null"],
+                    },
+                    "type": {
+                        "type": ["string", "null"],
+                    },
+                },
+            },
+        },
+        "tags": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": ["integer", "null"],
+                    },
+                    "name": {
+                        "type": ["string", "null"],
+                    },
+                    "uri": {
+                        "type": ["string", "null"],
+                    },
+                },
+            },
+        },
+        "messages_count": {
+            "type": ["integer", "null"],
+        },
+        "is_unread": {
+            "type": ["boolean", "null"],
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "opened_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "last_received_message_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "last_message_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "updated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "closed_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "snooze_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+    },
+}
+
+TICKET_DETAILS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "assignee_user": {
+            "type": ["object", "null"],
+            "properties": {
+                "id": {
+                    "type": ["integer", "null"],
+                },
+                "email": {
+                    "type": ["string", "null"],
+                },
+                "name": {
+                    "type": ["string", "null"],
+                },
+                "first_name": {
+                    "type": ["string", "null"],
+                },
+                "last_name": {
+                    "type": ["string", "null"],
+                },
+            },
+        },
+        "channel": {
+            "type": ["string", "null"],
+        },
+        "closed_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "customer": {
+            "type": ["object", "null"],
+            "properties": {
+                "id": {
+                    "type": ["integer", "null"],
+                },
+                "name": {
+                    "type": ["string", "null"],
+                },
+                "email": {
+                    "type": ["string", "null"],
+                },
+                "integrations": {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "shopify": {
+                            "type": ["object", "null"],
+                            "properties": {
+                                "id": {
+                                    "type": ["integer", "null"],
+                                },
+                                "orders": {
+                                    "type": ["array", "null"],
+                                    "items": {
+                                        "type": "object",
+                                        "properties": {
+                                            "id": {
+                                                "type": ["integer", "null"],
+                                            },
+                                            "name": {
+                                                "type": ["string", "null"],
+                                            },
+                                            "line_items": {
+                                                "type": ["array", "null"],
+                                                "items": {
+                                                    "type": "object",
+                                                    "properties": {
+                                                        "id": {
+                                                            "type": ["integer", "null"],
+                                                        },
+                                                    },
+                                                },
+                                            },
+                                        },
+                                    },
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        "events": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": ["integer", "null"],
+                    },
+                    "context": {
+                        "type": ["string", "null"],
+                    },
+                    "created_datetime": {
+                        "type": ["string", "null"],
+                        "format": "date-time",
+                    },
+                    "object_id": {
+                        "type": ["integer", "null"],
+                    },
+                    "date": {
+                        "type": ["string", "null"],
+                        "format": "date-time",
+                    },
+                    "object_type": {
+                        "type": ["string", "null"],
+                    },
+                    "type": {
+                        "type": ["string", "null"],
+                    },
+                    "user_id": {
+                        "type": ["integer", "null"],
+                    },
+                    "uri": {
+                        "type": ["string", "null"],
+                    },
+                },
+            },
+        },
+        "external_id": {
+            "type": ["string", "null"],
+        },
+        "from_agent": {
+            "type": ["boolean", "null"],
+        },
+        "is_unread": {
+            "type": ["boolean", "null"],
+        },
+        "language": {
+            "type": ["string", "null"],
+        },
+        "last_message_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "last_received_message_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "opened_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "priority": {
+            "type": ["string", "null"],
+        },
+        "snooze_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "spam": {
+            "type": ["boolean", "null"],
+        },
+        "status": {
+            "type": ["string", "null"],
+        },
+        "subject": {
+            "type": ["string", "null"],
+        },
+        "tags": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {
+                        "type": ["integer", "null"],
+                    },
+                    "name": {
+                        "type": ["string", "null"],
+                    },
+                    "decoration": {
+                        "type": ["object", "null"],
+                        "properties": {
+                            "color": {
+                                "type": ["string", "null"],
+                            },
+                        },
+                    },
+                },
+            },
+        },
+        "trashed_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "updated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "via": {
+            "type": ["string", "null"],
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+    },
+}
+
+MESSAGES = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+        "message_id": {
+            "type": ["string", "null"],
+        },
+        "ticket_id": {
+            "type": ["integer", "null"],
+        },
+        "external_id": {
+            "type": ["string", "null"],
+        },
+        "public": {
+            "type": ["boolean", "null"],
+        },
+        "channel": {
+            "type": ["string", "null"],
+        },
+        "via": {
+            "type": ["string", "null"],
+        },
+        "source": {
+            "type": ["object", "null"],
+            "properties": {
+                "type": {
+                    "type": ["string", "null"],
+                },
+                "to": {
+                    "type": ["array", "null"],
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": ["string", "null"],
+                            },
+                            "address": {
+                                "type": ["string", "null"],
+                            },
+                        },
+                    },
+                },
+                "from": {
+                    "type": ["object", "null"],
+                    "properties": {
+                        "name": {
+                            "type": ["string", "null"],
+                        },
+                        "address": {
+                            "type": ["string", "null"],
+                        },
+                    },
+                },
+            },
+        },
+        "sender": CUSTOMER,
+        "integration_id": {
+            "type": ["integer", "null"],
+        },
+        "rule_id": {
+            "type": ["integer", "null"],
+        },
+        "from_agent": {
+            "type": ["boolean", "null"],
+        },
+        "receiver": CUSTOMER,
+        "subject": {
+            "type": ["string", "null"],
+        },
+        "body_text": {
+            "type": ["string", "null"],
+        },
+        "body_html": {
+            "type": ["string", "null"],
+        },
+        "stripped_text": {
+            "type": ["string", "null"],
+        },
+        "stripped_html": {
+            "type": ["string", "null"],
+        },
+        "stripped_signature": {
+            "type": ["string", "null"],
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "sent_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "failed_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "deleted_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "opened_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+    },
+}
+
+SATISFACTION_SURVEYS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "body_text": {
+            "type": ["string", "null"],
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "customer_id": {
+            "type": ["integer", "null"],
+        },
+        "score": {
+            "type": ["integer", "null"],
+        },
+        "scored_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "sent_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "should_send_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "ticket_id": {
+            "type": ["integer", "null"],
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+    },
+}
+
+CUSTOMERS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "email": {
+            "type": ["string", "null"],
+        },
+        "external_id": {
+            "type": ["string", "null"],
+        },
+        "firstname": {
+            "type": ["string", "null"],
+        },
+        "language": {
+            "type": ["string", "null"],
+        },
+        "lastname": {
+            "type": ["string", "null"],
+        },
+        "name": {
+            "type": ["string", "null"],
+        },
+        "timezone": {
+            "type": ["string", "null"],
+        },
+        "updated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "note": {
+            "type": ["string", "null"],
+        },
+        "active": {
+            "type": ["boolean", "null"],
+        },
+        "meta": {
+            "type": ["object", "null"],
+            "properties": {
+                "name_set_via": {
+                    "type": ["string", "null"],
+                },
+            },
+        },
+        "error": {
+            "type": ["string", "null"],
+        },
+    },
+}
+
+INTEGRATIONS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+        "user": {
+            "type": ["object", "null"],
+            "properties": {
+                "id": {
+                    "type": ["integer", "null"],
+                },
+            },
+        },
+        "type": {
+            "type": ["string", "null"],
+        },
+        "name": {
+            "type": ["string", "null"],
+        },
+        "description": {
+            "type": ["string", "null"],
+        },
+        "meta": {
+            "type": ["object", "null"],
+            "properties": {
+                "shop_name": {
+                    "type": ["string", "null"],
+                },
+                "shop_display_name": {
+                    "type": ["string", "null"],
+                },
+                "shop_domain": {
+                    "type": ["string", "null"],
+                },
+                "shop_plan": {
+                    "type": ["string", "null"],
+                },
+                "shop_id": {
+                    "type": ["integer", "null"],
+                },
+                "shopify_integration_ids": {
+                    "type": ["array", "null"],
+                    "items": {
+                        "type": ["integer"],
+                    },
+                },
+                "shopify_integration_id": {
+                    "type": ["integer", "null"],
+                },
+                "shop_integration_id": {
+                    "type": ["integer", "null"],
+                },
+            },
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "updated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "deactivated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "locked_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "deleted_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+    },
+}
+
+MACROS = {
+    "type": "object",
+    "properties": {
+        "id": {
+            "type": ["integer", "null"],
+        },
+        "external_id": {
+            "type": ["string", "null"],
+        },
+        "name": {
+            "type": ["string", "null"],
+        },
+        "intent": {
+            "type": ["string", "null"],
+        },
+        "language": {
+            "type": ["string", "null"],
+        },
+        "usage": {
+            "type": ["integer", "null"],
+        },
+        "actions": {
+            "type": ["array", "null"],
+            "items": {
+                "type": "object",
+                "properties": {
+                    "arguments": {
+                        "type": ["object", "null"],
+                        "properties": {
+                            "body_html": {
+                                "type": ["string", "null"],
+                            },
+                            "body_text": {
+                                "type": ["string", "null"],
+                            },
+                            "tags": {
+                                "type": ["string", "null"],
+                            },
+                        },
+                        "additionalProperties": True,
+                    },
+                    "description": {
+                        "type": ["string", "null"],
+                    },
+                    "name": {
+                        "type": ["string", "null"],
+                    },
+                    "title": {
+                        "type": ["string", "null"],
+                    },
+                    "type": {
+                        "type": ["string", "null"],
+                    },
+                },
+            },
+        },
+        "created_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "updated_datetime": {
+            "type": ["string", "null"],
+            "format": "date-time",
+        },
+        "uri": {
+            "type": ["string", "null"],
+        },
+    },
+}
@@ -0,0 +1,454 @@
+"""Source definitions for the generated stream schemas in `tap_gorgias._schemas`.
+
+The stream classes read their schemas from `tap_gorgias._schemas`, a module of
+plain dict literals, so the nested typing helpers below are not evaluated on
+every tap start. After editing a schema here, regenerate the module with:
+
+    python -m tap_gorgias.build_schemas
+
+The generated schemas must stay plain, mutable dicts and lists. The SDK checks
+schema nodes with `isinstance(..., dict)` when conforming records and dropping
+deselected properties, so read-only mappings such as `types.MappingProxyType`
+would silently skip those steps for nested objects and arrays.
+"""
+import json
+import os
+
+from singer_sdk import typing as th  # JSON Schema typing helpers
+
+# Shared between several properties, and emitted once in the generated module.
+CUSTOMER = th.append_type(
+    th.ObjectType(
+        th.Property("id", th.IntegerType),
+        th.Property("email", th.StringType),
+        th.Property("name", th.StringType),
+        th.Property("firstname", th.StringType),
+        th.Property("lastname", th.StringType),
+    ).to_dict(),
+    "null",
+)
+
+TICKETS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("uri", th.StringType),
+    th.Property("external_id", th.StringType),
+    th.Property("language", th.StringType),
+    th.Property("status", th.StringType),
+    th.Property("priority", th.StringType),
+    th.Property("channel", th.StringType),
+    th.Property("via", th.StringType),
+    th.Property("from_agent", th.BooleanType),
+    th.Property("requester", th.CustomType(CUSTOMER)),
+    th.Property("customer", th.CustomType(CUSTOMER)),
+    th.Property("assignee_user", th.CustomType(CUSTOMER)),
+    th.Property(
+        "assignee_team",
+        th.ObjectType(
+            th.Property("id", th.IntegerType),
+            th.Property("name", th.StringType),
+            th.Property(
+                "decoration",
+                th.ObjectType(
+                    th.Property(
+                        "emoji",
+                        th.ObjectType(
+                            th.Property("id", th.StringType),
+                            th.Property("name", th.StringType),
+                            th.Property("skin", th.IntegerType),
+                            th.Property("colons", th.StringType),
+                            th.Property("native", th.StringType),
+                            th.Property("unified", th.StringType),
+                        ),
+                    )
+                ),
+            ),
+        ),
+    ),
+    th.Property("subject", th.StringType),
+    th.Property("excerpt", th.StringType),
+    th.Property(
+        "integrations",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("name", th.StringType),
+                th.Property("address", th.StringType),
+                th.Property("type", th.StringType),
+            )
+        ),
+    ),
+    th.Property(
+        "tags",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("id", th.IntegerType),
+                th.Property("name", th.StringType),
+                th.Property("uri", th.StringType),
+            )
+        ),
+    ),
+    th.Property("messages_count", th.IntegerType),
+    th.Property("is_unread", th.BooleanType),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property("opened_datetime", th.DateTimeType),
+    th.Property("last_received_message_datetime", th.DateTimeType),
+    th.Property("last_message_datetime", th.DateTimeType),
+    th.Property("updated_datetime", th.DateTimeType),
+    th.Property("closed_datetime", th.DateTimeType),
+    th.Property("snooze_datetime", th.DateTimeType),
+).to_dict()
+
+
+TICKET_DETAILS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property(
+        "assignee_user",
+        th.ObjectType(
+            th.Property("id", th.IntegerType),
+            th.Property("email", th.StringType),
+            th.Property("name", th.StringType),
+            th.Property("first_name", th.StringType),
+            th.Property("last_name", th.StringType),
+        ),
+    ),
+    th.Property("channel", th.StringType),
+    th.Property("closed_datetime", th.DateTimeType),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property(
+        "customer",
+        th.ObjectType(
+            th.Property("id", th.IntegerType),
+            th.Property("name", th.StringType),
+            th.Property("email", th.StringType),
+            th.Property(
+                "integrations",
+                th.ObjectType(
+                    th.Property(
+                        "shopify",
+                        th.ObjectType(
+                            th.Property("id", th.IntegerType),
+                            th.Property(
+                                "orders",
+                                th.ArrayType(
+                                    th.ObjectType(
+                                        th.Property("id", th.IntegerType),
+                                        th.Property("name", th.StringType),
+                                        th.Property(
+                                            "line_items",
+                                            th.ArrayType(
+                                                th.ObjectType(
+                                                    th.Property("id", th.IntegerType),
+                                                ),
+                                            )
+                                        ),
+                                    ),
+                                ),
+                            ),
+                        ),
+                    ),
+                ),
+            ),
+        ),
+    ),
+    th.Property(
+        "events",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("id", th.IntegerType),
+                th.Property("context", th.StringType),
+                th.Property("created_datetime", th.DateTimeType),
+                th.Property("object_id", th.IntegerType),
+                th.Property("date", th.DateTimeType),
+                th.Property("object_type", th.StringType),
+                th.Property("type", th.StringType),
+                th.Property("user_id", th.IntegerType),
+                th.Property("uri", th.StringType),
+            )
+        ),
+    ),
+    th.Property("external_id", th.StringType),
+    th.Property("from_agent", th.BooleanType),
+    th.Property("is_unread", th.BooleanType),
+    th.Property("language", th.StringType),
+    th.Property("last_message_datetime", th.DateTimeType),
+    th.Property("last_received_message_datetime", th.DateTimeType),
+    th.Property("opened_datetime", th.DateTimeType),
+    th.Property("priority", th.StringType),
+    th.Property("snooze_datetime", th.DateTimeType),
+    th.Property("spam", th.BooleanType),
+    th.Property("status", th.StringType),
+    th.Property("subject", th.StringType),
+    th.Property(
+        "tags",
+        th.ArrayType(
+            th.ObjectType(
+                th.Property("id", th.IntegerType),
+                th.Property("name", th.StringType),
+                th.Property("decoration", th.ObjectType(th.Property("color", th.StringType))),
+            )
+        ),
+    ),
+    th.Property("trashed_datetime", th.DateTimeType),
+    th.Property("updated_datetime", th.DateTimeType),
+    th.Property("via", th.StringType),
+    th.Property("uri", th.StringType),
+).to_dict()
+
+
+MESSAGES = th.PropertiesList(
+    th.Property(
+        "id",
+        th.IntegerType,
+    ),
+    th.Property(
+        "uri",
+        th.StringType,
+    ),
+    th.Property(
+        "message_id",
+        th.StringType,
+    ),
+    th.Property(
+        "ticket_id",
+        th.IntegerType,
+    ),
+    th.Property(
+        "external_id",
+        th.StringType,
+    ),
+    th.Property("public", th.BooleanType),
+    th.Property(
+        "channel",
+        th.StringType,
+    ),
+    th.Property(
+        "via",
+        th.StringType,
+    ),
+    th.Property(
+        "source",
+        th.ObjectType(
+            th.Property("type", th.StringType),
+            th.Property(
+                "to",
+                th.ArrayType(
+                    th.ObjectType(
+                        th.Property("name", th.StringType),
+                        th.Property("address", th.StringType),
+                    )
+                ),
+            ),
+            th.Property(
+                "from",
+                th.ObjectType(
+                    th.Property("name", th.StringType),
+                    th.Property("address", th.StringType),
+                ),
+            ),
+        ),
+    ),
+    th.Property("sender", th.CustomType(CUSTOMER)),
+    th.Property(
+        "integration_id",
+        th.IntegerType,
+    ),
+    th.Property(
+        "rule_id",
+        th.IntegerType,
+    ),
+    th.Property("from_agent", th.BooleanType),
+    th.Property("receiver", th.CustomType(CUSTOMER)),
+    th.Property(
+        "subject",
+        th.StringType,
+    ),
+    th.Property(
+        "body_text",
+        th.StringType,
+    ),
+    th.Property(
+        "body_html",
+        th.StringType,
+    ),
+    th.Property(
+        "stripped_text",
+        th.StringType,
+    ),
+    th.Property(
+        "stripped_html",
+        th.StringType,
+    ),
+    th.Property(
+        "stripped_signature",
+        th.StringType,
+    ),
+    # th.Property(
+    #     "actions",
+    #     th.ArrayType(
+    #         th.ObjectType()
+    #     ),
+    # ),
+    th.Property(
+        "created_datetime",
+        th.DateTimeType,
+    ),
+    th.Property("sent_datetime", th.DateTimeType),
+    th.Property("failed_datetime", th.DateTimeType),
+    th.Property("deleted_datetime", th.DateTimeType),
+    th.Property("opened_datetime", th.DateTimeType),
+).to_dict()
+
+
+SATISFACTION_SURVEYS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("body_text", th.StringType),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property("customer_id", th.IntegerType),
+    th.Property("score", th.IntegerType),
+    th.Property("scored_datetime", th.DateTimeType),
+    th.Property("sent_datetime", th.DateTimeType),
+    th.Property("should_send_datetime", th.DateTimeType),
+    th.Property("ticket_id", th.IntegerType),
+    th.Property("uri", th.StringType),
+).to_dict()
+
+
+CUSTOMERS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property("email", th.StringType),
+    th.Property("external_id", th.StringType),
+    th.Property("firstname", th.StringType),
+    th.Property("language", th.StringType),
+    th.Property("lastname", th.StringType),
+    th.Property("name", th.StringType),
+    th.Property("timezone", th.StringType),
+    th.Property("updated_datetime", th.DateTimeType),
+    th.Property("note", th.StringType),
+    th.Property("active", th.BooleanType),
+    th.Property(
+        "meta",
+        th.ObjectType(
+            th.Property("name_set_via", th.StringType),
+        ),
+    ),
+    th.Property("error", th.StringType),
+).to_dict()
+
+
+INTEGRATIONS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("uri", th.StringType),
+    th.Property(
+        "user",
+        th.ObjectType(th.Property("id", th.IntegerType)),
+    ),
+    th.Property("type", th.StringType),
+    th.Property("name", th.StringType),
+    th.Property("description", th.StringType),
+    th.Property(
+        "meta",
+        th.ObjectType(
+            th.Property("shop_name", th.StringType),
+            th.Property("shop_display_name", th.StringType),
+            th.Property("shop_domain", th.StringType),
+            th.Property("shop_plan", th.StringType),
+            th.Property("shop_id", th.IntegerType),
+            th.Property("shopify_integration_ids", th.ArrayType(th.IntegerType)),
+            th.Property("shopify_integration_id", th.IntegerType),
+            th.Property("shop_integration_id", th.IntegerType),
+        ),
+    ),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property("updated_datetime", th.DateTimeType),
+    th.Property("deactivated_datetime", th.DateTimeType),
+    th.Property("locked_datetime", th.DateTimeType),
+    th.Property("deleted_datetime", th.DateTimeType),
+).to_dict()
+
+
+MACROS = th.PropertiesList(
+    th.Property("id", th.IntegerType),
+    th.Property("external_id", th.StringType),
+    th.Property("name", th.StringType),
+    th.Property("intent", th.StringType),
+    th.Property("language", th.StringType),
+    th.Property("usage", th.IntegerType),
+    th.Property("actions", th.ArrayType(
+        th.ObjectType(
+            th.Property("arguments", th.ObjectType(
+                th.Property("body_html", th.StringType),
+                th.Property("body_text", th.StringType),
+                th.Property("tags", th.StringType),
+                additional_properties=True,
+            )),
+            th.Property("description", th.StringType),
+            th.Property("name", th.StringType),
+            th.Property("title", th.StringType),
+            th.Property("type", th.StringType),
+        )
+    )),
+    th.Property("created_datetime", th.DateTimeType),
+    th.Property("updated_datetime", th.DateTimeType),
+    th.Property("uri", th.StringType),
+).to_dict()
+
+# Schema fragments referenced by name from the stream schemas.
+FRAGMENTS = {
+    "CUSTOMER": CUSTOMER,
+}
+
+SCHEMAS = {
+    "TICKETS": TICKETS,
+    "TICKET_DETAILS": TICKET_DETAILS,
+    "MESSAGES": MESSAGES,
+    "SATISFACTION_SURVEYS": SATISFACTION_SURVEYS,
+    "CUSTOMERS": CUSTOMERS,
+    "INTEGRATIONS": INTEGRATIONS,
+    "MACROS": MACROS,
+}
+
+HEADER = (
+    '"""Stream schemas generated by `python -m tap_gorgias.build_schemas`.\n\n'
+    'Do not edit by hand, edit `tap_gorgias/build_schemas.py` instead.\n"""\n'
+)
+
+
+def _literal(value, indent: int = 0) -> str:
+    """Render a JSON-compatible value as a Python literal, one key per line."""
+    pad = " " * (indent + 4)
+    for name, fragment in FRAGMENTS.items():
+        if indent and value == fragment:
+            return name
+    if isinstance(value, dict) and value:
+        items = "".join(
+            f"{pad}{json.dumps(key)}: {_literal(val, indent + 4)},\n"
+            for key, val in value.items()
+        )
+        return "{\n" + items + " " * indent + "}"
+    if isinstance(value, list):
+        if any(isinstance(val, (dict, list)) for val in value):
+            items = "".join(f"{pad}{_literal(val, indent + 4)},\n" for val in value)
+            return "[\n" + items + " " * indent + "]"
+        return "[" + ", ".join(_literal(val) for val in value) + "]"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return repr(value)
+
+
+def render() -> str:
+    """Return the source of the generated schemas module."""
+    parts = [HEADER]
+    for name, schema in {**FRAGMENTS, **SCHEMAS}.items():
+        parts.append(f"\n{name} = {_literal(schema)}\n")
+    return "".join(parts)
+
+
+def main() -> None:
+    """Write the generated schemas module next to this file."""
+    path = os.path.join(os.path.dirname(__file__), "_schemas.py")
+    with open(path, "w") as f:
+        f.write(render())
+
+
+if __name__ == "__main__":
+    main()
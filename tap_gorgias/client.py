@@ -1,9 +1,18 @@
 """REST client handling, including GorgiasStream base class."""
 
+import queue
+import re
+import sqlite3
+import threading
 import time
-from typing import Dict, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Optional, Any, Set, Tuple, cast
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from singer_sdk import metrics
 from singer_sdk.helpers.jsonpath import extract_jsonpath
 
 from singer_sdk.streams import RESTStream
@@ -11,6 +20,56 @@ from singer_sdk.authenticators import BasicAuthenticator
 from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
 
 
+@lru_cache(maxsize=None)
+def _simple_jsonpath_keys(jsonpath: str) -> Optional[Tuple[str, ...]]:
+    """Return the keys of a plain `$.a.b` jsonpath, or None for any other path."""
+    if not re.fullmatch(r"\$(\.\w+)+", jsonpath):
+        return None
+    return tuple(jsonpath.split(".")[1:])
+
+
+def _compile_drop_keys(
+    drop_keys: Tuple[str, ...],
+    drop_keys_nested: Tuple[str, ...],
+    drop_keys_present: Tuple[str, ...] = (),
+) -> Callable:
+    """Return a `post_process` method removing `drop_keys` without looping over them.
+
+    Args:
+        drop_keys: Fields to remove from the record.
+        drop_keys_nested: List fields of the record, whose items also get
+            `drop_keys` removed.
+        drop_keys_present: Fields of `drop_keys` nearly always present in the
+            nested items. They are removed with a single `del`, instead of a
+            `pop` returning a default.
+
+    Returns:
+        The generated `post_process` function.
+    """
+
+    def removal(target: str, key: str, indent: str, present: bool) -> List[str]:
+        if not present:
+            return [f"{indent}{target}.pop({key!r}, None)"]
+        return [
+            f"{indent}try:",
+            f"{indent}    del {target}[{key!r}]",
+            f"{indent}except KeyError:",
+            f"{indent}    pass",
+        ]
+
+    lines = ["def post_process(self, row, context=None):"]
+    for key in drop_keys:
+        lines += removal("row", key, "    ", False)
+    for field in drop_keys_nested:
+        lines.append(f"    for item in row.get({field!r}, ()):")
+        for key in drop_keys:
+            lines += removal("item", key, "        ", key in drop_keys_present)
+    lines.append("    return row")
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), {}, namespace)
+    return namespace["post_process"]
+
+
 class GorgiasStream(RESTStream):
     """Gorgias stream class."""
 
@@ -24,9 +83,45 @@ class GorgiasStream(RESTStream):
     # https://developers.gorgias.com/reference/pagination#response-attributes
     records_jsonpath = "$.data[*]"
 
-    http_headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    # Brotli compresses the large ticket payloads better than gzip, responses
+    # are decoded by urllib3 with the `brotli` package.
+    http_headers = {
+        "Accept": "application/json",
+        "Accept-Encoding": "br, gzip",
+        "Content-Type": "application/json",
+    }
     _LOG_REQUEST_METRIC_URLS = True
 
+    # Size of the connection pool of the requests session, large enough for the
+    # worker threads of the concurrent child streams.
+    pool_size = 32
+
+    # Fields to remove from every record, list fields of the record whose items
+    # should have the same fields removed, and the fields nearly always present
+    # in those items. When set on a subclass, a straight-line `post_process` is
+    # generated for it.
+    _drop_keys: Tuple[str, ...] = ()
+    _drop_keys_nested: Tuple[str, ...] = ()
+    _drop_keys_present: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Generate `post_process` for subclasses declaring `_drop_keys`."""
+        super().__init_subclass__(**kwargs)
+        if "_drop_keys" in cls.__dict__:
+            post_process = _compile_drop_keys(
+                cls._drop_keys, cls._drop_keys_nested, cls._drop_keys_present
+            )
+            post_process.__qualname__ = f"{cls.__qualname__}.post_process"
+            cls.post_process = post_process  # type: ignore[assignment]
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Size the connection pool of the requests session."""
+        super().__init__(*args, **kwargs)
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_size, pool_maxsize=self.pool_size
+        )
+        self.requests_session.mount("https://", adapter)
+
     @property
     def url_base(self) -> str:
         """Return the API URL root, configurable via tap settings."""
@@ -112,6 +207,29 @@ class GorgiasStream(RESTStream):
         """
         return {"cursor": next_page_token, "limit": self.config["page_size"]}
 
+    def parse_response(self, response: requests.Response) -> Iterable[dict]:
+        """Parse the response and return an iterator of result records.
+
+        Response bodies are decoded with `orjson`, which is considerably faster
+        than the standard library on the large payloads returned by Gorgias.
+
+        Args:
+            response: A raw `requests.Response`_ object.
+
+        Yields:
+            One item for every item found in the response.
+
+        .. _requests.Response:
+            https://docs.python-requests.org/en/latest/api/#requests.Response
+        """
+        yield from extract_jsonpath(
+            self.records_jsonpath, input=orjson.loads(self.response_content(response))
+        )
+
+    def response_content(self, response: requests.Response) -> bytes:
+        """Return the body of the response, to be decoded as JSON."""
+        return response.content
+
     def get_next_page_token(
         self, response: requests.Response, previous_token: Optional[Any]
     ) -> Any:
@@ -127,7 +245,14 @@ class GorgiasStream(RESTStream):
         .. _requests.Response:
             https://docs.python-requests.org/en/latest/api/#requests.Response
         """
-        all_matches = extract_jsonpath(self.next_page_token_jsonpath, response.json())
+        body = orjson.loads(self.response_content(response))
+        keys = _simple_jsonpath_keys(self.next_page_token_jsonpath)
+        if keys is not None:
+            # Plain `$.a.b` path, walk the dicts instead of evaluating the jsonpath
+            for key in keys:
+                body = body.get(key) if isinstance(body, dict) else None
+            return body
+        all_matches = extract_jsonpath(self.next_page_token_jsonpath, body)
         first_match = next(iter(all_matches), None)
         next_page_token = first_match
         return next_page_token
@@ -152,3 +277,269 @@ class GorgiasStream(RESTStream):
                 f"{response.status_code} {error_type} Error: "
                 f"{response.reason} for path: {full_path}"
             )
+
+
+class ConcurrentChildStream(GorgiasStream):
+    """Base class for ticket child streams fetching tickets concurrently.
+
+    The tickets parent stream hands over ticket ids in batches of `batch_size`,
+    through a `ticket_ids` context. The requests of a batch are sent by
+    `max_workers` threads sharing the stream's requests session, so their
+    latency overlaps instead of adding up, and the records are yielded as the
+    tickets complete.
+
+    The SDK does not validate the records against the schema, it only conforms
+    them. Its default recursive conformance is kept even though the decoded JSON
+    needs no type conversion, as it also strips the nested fields missing from
+    the schema, such as most of the Shopify order fields of ticket details.
+    """
+
+    batch_size = 32
+    max_workers = 16
+    # Smaller than `batch_size`, for the queue to bound the tickets held in
+    # memory when parsing falls behind the requests.
+    queue_size = 8
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the lock serializing the preparation of requests."""
+        super().__init__(*args, **kwargs)
+        self._prepare_lock = threading.Lock()
+
+    def request_ticket_pages(self, context: dict) -> List[requests.Response]:
+        """Request every page of a single ticket. Runs in a worker thread.
+
+        Args:
+            context: Ticket context, with the `ticket_id` to fetch.
+
+        Returns:
+            The responses of all the pages, in order.
+        """
+        paginator = self.get_new_paginator()
+        decorated_request = self.request_decorator(self._request)
+        responses = []
+        while not paginator.finished:
+            # Preparing a request assigns the session's auth and merges its
+            # headers and cookies, which is not safe from several threads at
+            # once. Only the sending is left to run concurrently.
+            with self._prepare_lock:
+                prepared_request = self.prepare_request(
+                    context, next_page_token=paginator.current_value
+                )
+            response = decorated_request(prepared_request, context)
+            responses.append(response)
+            paginator.advance(response)
+        return responses
+
+    def _produce_ticket(
+        self, ticket_id: int, results: queue.Queue, stopped: threading.Event
+    ) -> None:
+        """Request the pages of a ticket and put them on the results queue.
+
+        Runs in a worker thread. Request errors are put on the queue, to be
+        raised by the thread draining it.
+        """
+        try:
+            result: Any = self.request_ticket_pages({"ticket_id": ticket_id})
+        except Exception as ex:
+            result = ex
+        while not stopped.is_set():
+            try:
+                results.put((ticket_id, result), timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def _ticket_records(
+        self,
+        ticket_id: int,
+        responses: List[requests.Response],
+        request_counter: metrics.Counter,
+    ) -> Iterable[Dict[str, Any]]:
+        """Return the processed records of the responses of a single ticket.
+
+        The requests are counted and their sync costs updated here rather than
+        in the worker threads, as the SDK does it in `request_records`.
+        """
+        ticket_context = {"ticket_id": ticket_id}
+        for response in responses:
+            request_counter.increment()
+            self.update_sync_costs(response.request, response, ticket_context)
+            for record in self.parse_response(response):
+                transformed_record = self.post_process(record, ticket_context)
+                if transformed_record is None:
+                    # Record filtered out during post_process()
+                    continue
+                yield transformed_record
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
+        """Return the records of a batch of tickets.
+
+        The worker threads put the responses of each ticket on a queue holding
+        at most `queue_size` tickets, which this thread drains to parse and
+        process the records. Parsing overlaps with the requests still in flight.
+        When parsing falls behind, workers wait for room on the queue, so no
+        more than `queue_size + max_workers` tickets are held at once.
+
+        Rate limiting is handled per request by `validate_response`, so every
+        worker hitting a 429 waits for the `Retry-after` delay before retrying.
+
+        Args:
+            context: Stream context, with the batch of `ticket_ids` to fetch.
+
+        Yields:
+            One item per (possibly processed) record in the API.
+        """
+        ticket_ids = context["ticket_ids"]
+        results: queue.Queue = queue.Queue(maxsize=self.queue_size)
+        stopped = threading.Event()
+        with metrics.http_request_counter(
+            self.name, self.path
+        ) as request_counter, ThreadPoolExecutor(
+            max_workers=self.max_workers
+        ) as executor:
+            request_counter.context = context
+            futures = [
+                executor.submit(self._produce_ticket, ticket_id, results, stopped)
+                for ticket_id in ticket_ids
+            ]
+            try:
+                for _ in ticket_ids:
+                    ticket_id, result = results.get()
+                    if isinstance(result, Exception):
+                        raise result
+                    yield from self._ticket_records(
+                        ticket_id, result, request_counter
+                    )
+            finally:
+                # Let the workers exit if the records are not all consumed
+                stopped.set()
+                for future in futures:
+                    future.cancel()
+
+
+class CachedPagesStream(GorgiasStream):
+    """Base class for full refresh streams caching their pages between syncs.
+
+    When the `etag_cache_path` setting is set, the body and `ETag` of every
+    page are stored in a SQLite database at that path, keyed by the request
+    URL. On the next sync the stored `ETag` is sent as `If-None-Match`, and a
+    `304 Not Modified` answer is served from the stored body, without the page
+    being downloaded again.
+    """
+
+    _cache_connection: Optional[sqlite3.Connection] = None
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the URLs of the pages requested during the sync."""
+        super().__init__(*args, **kwargs)
+        # The cached pages of the stream missing from it are pruned
+        self._synced_urls: Set[str] = set()
+
+    @property
+    def cache_connection(self) -> Optional[sqlite3.Connection]:
+        """Return the connection to the page cache, or None if caching is off."""
+        cache_path = self.config.get("etag_cache_path")
+        if cache_path and self._cache_connection is None:
+            self._cache_connection = sqlite3.connect(cache_path)
+            self._cache_connection.execute(
+                "CREATE TABLE IF NOT EXISTS pages "
+                "(url TEXT PRIMARY KEY, etag TEXT NOT NULL, content BLOB NOT NULL)"
+            )
+        return self._cache_connection
+
+    def _cached_row(self, url: Optional[str], column: str) -> Optional[tuple]:
+        """Return the `etag` or `content` of a cached page, as a row."""
+        connection = cast(sqlite3.Connection, self.cache_connection)
+        return connection.execute(
+            f"SELECT {column} FROM pages WHERE url = ?", (url,)
+        ).fetchone()
+
+    def prepare_request(
+        self, context: Optional[dict], next_page_token: Optional[Any]
+    ) -> requests.PreparedRequest:
+        """Prepare a request, made conditional if the page is in the cache."""
+        prepared_request = super().prepare_request(context, next_page_token)
+        if self.cache_connection is not None:
+            row = self._cached_row(prepared_request.url, "etag")
+            if row:
+                prepared_request.headers["If-None-Match"] = row[0]
+        return prepared_request
+
+    def _request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        """Send the request and store the page in the cache if it has an ETag.
+
+        A `304 Not Modified` answer for a page missing from the cache, which
+        was removed since the request was prepared, is requested again without
+        `If-None-Match`.
+        """
+        response = super()._request(prepared_request, context)
+        connection = self.cache_connection
+        if connection is None:
+            return response
+        url = cast(str, prepared_request.url)
+        if response.status_code == 304 and not self._cached_row(url, "etag"):
+            prepared_request.headers.pop("If-None-Match", None)
+            response = super()._request(prepared_request, context)
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO pages (url, etag, content) "
+                    "VALUES (?, ?, ?)",
+                    (url, etag, response.content),
+                )
+        self._synced_urls.add(url)
+        return response
+
+    def response_content(self, response: requests.Response) -> bytes:
+        """Return the body of the response, from the cache if it was not modified."""
+        if response.status_code == 304 and self.cache_connection is not None:
+            row = self._cached_row(response.request.url, "content")
+            if row is None:
+                raise FatalAPIError(
+                    f"Page {response.request.path_url} was not modified "
+                    "but is missing from the cache"
+                )
+            return row[0]
+        return response.content
+
+    def prune_cache(self, context: Optional[dict]) -> None:
+        """Remove the cached pages of the stream that were not requested.
+
+        Pages are keyed by URL, which includes the pagination cursor, so pages
+        reached through cursors that are no longer returned would otherwise
+        stay in the cache forever.
+        """
+        connection = cast(sqlite3.Connection, self.cache_connection)
+        stream_url = self.get_url(context)
+        rows = connection.execute(
+            "SELECT url FROM pages WHERE substr(url, 1, ?) = ?",
+            (len(stream_url), stream_url),
+        ).fetchall()
+        stale_urls = [
+            (url,)
+            for (url,) in rows
+            if url not in self._synced_urls
+            and (url == stream_url or url[len(stream_url)] == "?")
+        ]
+        with connection:
+            connection.executemany(
+                "DELETE FROM pages WHERE url = ?", stale_urls
+            )
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
+        """Return the records of the stream, then prune and close the cache.
+
+        The cache is only pruned once every page was requested.
+        """
+        self._synced_urls.clear()
+        try:
+            yield from super().get_records(context)
+            if self.cache_connection is not None:
+                self.prune_cache(context)
+        finally:
+            if self._cache_connection is not None:
+                self._cache_connection.close()
+                self._cache_connection = None
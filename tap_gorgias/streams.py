@@ -1,25 +1,31 @@
 """Stream type classes for tap-gorgias."""
+import copy
 from urllib import parse
 from datetime import datetime
 import logging
 import json
+import ijson
+import orjson
 import requests
-from typing import Any, Dict, Optional, Iterable, cast
-from singer_sdk import typing as th  # JSON Schema typing helpers
-
-from tap_gorgias.client import GorgiasStream
+import urllib3
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Iterable, cast
+from singer_sdk.exceptions import RetriableAPIError
+from tap_gorgias import _schemas
+
+from tap_gorgias.client import (
+    CachedPagesStream,
+    ConcurrentChildStream,
+    GorgiasStream,
+)
 
 logger = logging.getLogger(__name__)
 
-CUSTOMER_SCHEMA = [
-    th.ObjectType(
-        th.Property("id", th.IntegerType),
-        th.Property("email", th.StringType),
-        th.Property("name", th.StringType),
-        th.Property("firstname", th.StringType),
-        th.Property("lastname", th.StringType),
-    )
-]
+# Ticket and message body fields, dropped from ticket details records.
+BODY_KEYS = ("body_text", "body_html", "stripped_text", "stripped_html")
+
+# Shared, read-only URL parameters of the requests without any.
+NO_URL_PARAMS: Mapping[str, Any] = MappingProxyType({})
 
 class TicketsStream(GorgiasStream):
     """Define custom stream."""
@@ -33,74 +39,7 @@ class TicketsStream(GorgiasStream):
     # Link to the next items, if any.
     next_page_token_jsonpath = "$.meta.next_items"
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("uri", th.StringType),
-        th.Property("external_id", th.StringType),
-        th.Property("language", th.StringType),
-        th.Property("status", th.StringType),
-        th.Property("priority", th.StringType),
-        th.Property("channel", th.StringType),
-        th.Property("via", th.StringType),
-        th.Property("from_agent", th.BooleanType),
-        th.Property("requester", *CUSTOMER_SCHEMA),
-        th.Property("customer", *CUSTOMER_SCHEMA),
-        th.Property("assignee_user", *CUSTOMER_SCHEMA),
-        th.Property(
-            "assignee_team",
-            th.ObjectType(
-                th.Property("id", th.IntegerType),
-                th.Property("name", th.StringType),
-                th.Property(
-                    "decoration",
-                    th.ObjectType(
-                        th.Property(
-                            "emoji",
-                            th.ObjectType(
-                                th.Property("id", th.StringType),
-                                th.Property("name", th.StringType),
-                                th.Property("skin", th.IntegerType),
-                                th.Property("colons", th.StringType),
-                                th.Property("native", th.StringType),
-                                th.Property("unified", th.StringType),
-                            ),
-                        )
-                    ),
-                ),
-            ),
-        ),
-        th.Property("subject", th.StringType),
-        th.Property("excerpt", th.StringType),
-        th.Property(
-            "integrations",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("name", th.StringType),
-                    th.Property("address", th.StringType),
-                    th.Property("type", th.StringType),
-                )
-            ),
-        ),
-        th.Property(
-            "tags",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("id", th.IntegerType),
-                    th.Property("name", th.StringType),
-                    th.Property("uri", th.StringType),
-                )
-            ),
-        ),
-        th.Property("messages_count", th.IntegerType),
-        th.Property("is_unread", th.BooleanType),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property("opened_datetime", th.DateTimeType),
-        th.Property("last_received_message_datetime", th.DateTimeType),
-        th.Property("last_message_datetime", th.DateTimeType),
-        th.Property("updated_datetime", th.DateTimeType),
-        th.Property("closed_datetime", th.DateTimeType),
-        th.Property("snooze_datetime", th.DateTimeType),
-    ).to_dict()
+    schema = _schemas.TICKETS
 
     def prepare_request(
         self, context: Optional[dict], next_page_token: Optional[Any]
@@ -233,6 +172,7 @@ class TicketsStream(GorgiasStream):
         view_id = self.create_ticket_view(sync_start_datetime)
         context = context or {}
         context["view_id"] = view_id
+        self._child_batches: Dict[str, List[int]] = {}
         try:
             for record in self.request_records(context):
                 transformed_record = self.post_process(record, context)
@@ -240,13 +180,52 @@ class TicketsStream(GorgiasStream):
                     # Record filtered out during post_process()
                     continue
                 yield transformed_record
+            # Sync the last, possibly partial, batches of the child streams
+            for child_stream in self.child_streams:
+                if isinstance(child_stream, ConcurrentChildStream):
+                    self._sync_child_batch(child_stream)
         finally:
             # Always delete the ticket view even if an exception is raised
             self.delete_ticket_view(view_id)
 
     def get_child_context(self, record: dict, context: Optional[dict]) -> dict:
-        """Return the ticket_id for use by child streams."""
-        return {"ticket_id": record["id"]}
+        """Return the ticket_id for use by child streams.
+
+        Tickets whose details are not needed, per the `ticket_details_statuses`
+        setting, also pass the ticket itself, to build their details from.
+        """
+        child_context = {"ticket_id": record["id"]}
+        statuses = self.config.get("ticket_details_statuses")
+        if statuses and record.get("status") not in statuses:
+            child_context["ticket"] = record
+        return child_context
+
+    def _sync_children(self, child_context: dict) -> None:
+        """Sync child streams for a single ticket.
+
+        Concurrent child streams fetch tickets in batches, so their ticket ids are
+        buffered until a batch is full. Other child streams are synced ticket by
+        ticket.
+        """
+        for child_stream in self.child_streams:
+            if not (child_stream.selected or child_stream.has_selected_descendents):
+                continue
+            listed_ticket = child_context.get("ticket")
+            if listed_ticket and isinstance(child_stream, TicketDetailsStream):
+                child_stream.add_listed_ticket(listed_ticket)
+            if isinstance(child_stream, ConcurrentChildStream):
+                batch = self._child_batches.setdefault(child_stream.name, [])
+                batch.append(child_context["ticket_id"])
+                if len(batch) >= child_stream.batch_size:
+                    self._sync_child_batch(child_stream)
+            else:
+                child_stream.sync(context={"ticket_id": child_context["ticket_id"]})
+
+    def _sync_child_batch(self, child_stream: ConcurrentChildStream) -> None:
+        """Sync a concurrent child stream for all its buffered ticket ids."""
+        ticket_ids = self._child_batches.pop(child_stream.name, [])
+        if ticket_ids:
+            child_stream.sync(context={"ticket_ids": ticket_ids})
 
     def get_url_params(
         self, context: Optional[dict], next_page_token: Optional[Any]
@@ -278,10 +257,32 @@ class TicketsStream(GorgiasStream):
         # Hopefully Gorgias fixes their API and that doesn't become an issue.
         # Once Gorgias has fixed their sorting, this override can be safely removed.
 
-        data = response.json()["data"]
+        # Datetimes are kept as the API's ISO 8601 strings, which sort chronologically
+        # as such. Neither this tap nor the SDK parses them per record.
+        data = orjson.loads(response.content)["data"]
         return sorted(data, key=lambda ticket: ticket["updated_datetime"])
 
-class TicketDetailsStream(GorgiasStream):
+class DecodedResponse(requests.Response):
+    """Response whose JSON body was decoded while it was read.
+
+    Its body was consumed, so `content` is not available, the decoded body is
+    in `decoded_body` instead.
+    """
+
+    decoded_body: Any = None
+
+    @classmethod
+    def from_response(
+        cls, response: requests.Response, decoded_body: Any
+    ) -> "DecodedResponse":
+        """Return a copy of the response, holding its decoded body."""
+        decoded_response = cls.__new__(cls)
+        decoded_response.__dict__.update(response.__dict__)
+        decoded_response.decoded_body = decoded_body
+        return decoded_response
+
+
+class TicketDetailsStream(ConcurrentChildStream):
     """Uses tickets as a parent stream. This stream is used to get the details of a ticket which are not available
     in the List Ticket view, like spam or integration details."""
 
@@ -291,106 +292,129 @@ class TicketDetailsStream(GorgiasStream):
     primary_keys = ["id"]
     state_partitioning_keys = []
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property(
-            "assignee_user",
-            th.ObjectType(
-                th.Property("id", th.IntegerType),
-                th.Property("email", th.StringType),
-                th.Property("name", th.StringType),
-                th.Property("first_name", th.StringType),
-                th.Property("last_name", th.StringType),
-            ),
-        ),
-        th.Property("channel", th.StringType),
-        th.Property("closed_datetime", th.DateTimeType),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property(
-            "customer",
-            th.ObjectType(
-                th.Property("id", th.IntegerType),
-                th.Property("name", th.StringType),
-                th.Property("email", th.StringType),
-                th.Property(
-                    "integrations",
-                    th.ObjectType(
-                        th.Property(
-                            "shopify",
-                            th.ObjectType(
-                                th.Property("id", th.IntegerType),
-                                th.Property(
-                                    "orders",
-                                    th.ArrayType(
-                                        th.ObjectType(
-                                            th.Property("id", th.IntegerType),
-                                            th.Property("name", th.StringType),
-                                            th.Property(
-                                                "line_items",
-                                                th.ArrayType(
-                                                    th.ObjectType(
-                                                        th.Property("id", th.IntegerType),
-                                                    ),
-                                                )
-                                            ),
-                                        ),
-                                    ),
-                                ),
-                            ),
-                        ),
-                    ),
-                ),
-            ),
-        ),
-        th.Property(
-            "events",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("id", th.IntegerType),
-                    th.Property("context", th.StringType),
-                    th.Property("created_datetime", th.DateTimeType),
-                    th.Property("object_id", th.IntegerType),
-                    th.Property("date", th.DateTimeType),
-                    th.Property("object_type", th.StringType),
-                    th.Property("type", th.StringType),
-                    th.Property("user_id", th.IntegerType),
-                    th.Property("uri", th.StringType),
-                )
-            ),
-        ),
-        th.Property("external_id", th.StringType),
-        th.Property("from_agent", th.BooleanType),
-        th.Property("is_unread", th.BooleanType),
-        th.Property("language", th.StringType),
-        th.Property("last_message_datetime", th.DateTimeType),
-        th.Property("last_received_message_datetime", th.DateTimeType),
-        th.Property("opened_datetime", th.DateTimeType),
-        th.Property("priority", th.StringType),
-        th.Property("snooze_datetime", th.DateTimeType),
-        th.Property("spam", th.BooleanType),
-        th.Property("status", th.StringType),
-        th.Property("subject", th.StringType),
-        th.Property(
-            "tags",
-            th.ArrayType(
-                th.ObjectType(
-                    th.Property("id", th.IntegerType),
-                    th.Property("name", th.StringType),
-                    th.Property("decoration", th.ObjectType(th.Property("color", th.StringType))),
-                )
-            ),
-        ),
-        th.Property("trashed_datetime", th.DateTimeType),
-        th.Property("updated_datetime", th.DateTimeType),
-        th.Property("via", th.StringType),
-        th.Property("uri", th.StringType),
-    ).to_dict()
+    schema = _schemas.TICKET_DETAILS
+
+    # Remove the ticket and related messages html as it messes up json serialization.
+    # We can load these via the Messages stream if needed.
+    _drop_keys = BODY_KEYS
+    _drop_keys_nested = ("messages",)
+    _drop_keys_present = ("body_html", "stripped_html")
+
+    # Responses larger than this, in bytes, are parsed incrementally from the
+    # socket instead of being loaded in memory first.
+    stream_parse_threshold = 256 * 1024
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Initialize the details built from listed tickets, by ticket id."""
+        super().__init__(*args, **kwargs)
+        self._listed_ticket_details: Dict[int, dict] = {}
+
+    def add_listed_ticket(self, ticket: dict) -> None:
+        """Build the details of a ticket from its tickets stream record.
+
+        The ticket will not be requested. Only the fields of the ticket details
+        schema are kept, so the details lack the fields missing from the tickets
+        list, such as `events` and `spam`.
+
+        The details are deep-copied, as the tickets record is only written after
+        its child streams are synced, and the details' deselected properties are
+        removed in place.
+        """
+        properties = self.schema["properties"]
+        self._listed_ticket_details[ticket["id"]] = copy.deepcopy(
+            {key: value for key, value in ticket.items() if key in properties}
+        )
+
+    def get_records(self, context: Optional[dict]) -> Iterable[Dict[str, Any]]:
+        """Return the details of a batch of tickets.
+
+        Details built from listed tickets are yielded first, the other tickets
+        are requested.
+
+        Args:
+            context: Stream context, with the batch of `ticket_ids` to fetch.
+
+        Yields:
+            One item per (possibly processed) ticket.
+        """
+        requested_ticket_ids = []
+        for ticket_id in context["ticket_ids"]:
+            details = self._listed_ticket_details.pop(ticket_id, None)
+            if details is None:
+                requested_ticket_ids.append(ticket_id)
+                continue
+            transformed_record = self.post_process(details, {"ticket_id": ticket_id})
+            if transformed_record is not None:
+                yield transformed_record
+        if requested_ticket_ids:
+            yield from super().get_records({"ticket_ids": requested_ticket_ids})
+
+    def _is_large_response(self, response: requests.Response) -> bool:
+        """Return whether the response body should be parsed incrementally.
+
+        `Content-Length` is the size of the body as sent, compressed when the
+        response has a `Content-Encoding`, so the decoded ticket is usually a
+        few times larger than the threshold. Bodies sent without a length, in
+        chunks, are of unknown size and parsed incrementally too.
+        """
+        content_length = response.headers.get("Content-Length")
+        if content_length is None:
+            return True
+        return int(content_length) > self.stream_parse_threshold
+
+    def _request(
+        self, prepared_request: requests.PreparedRequest, context: Optional[dict]
+    ) -> requests.Response:
+        """Send the request and read its body, in the worker thread.
+
+        Large bodies are decoded incrementally from the socket, so the raw body
+        and the decoded ticket are never both held in memory, and the response
+        is returned as a `DecodedResponse` holding the decoded ticket. Errors
+        reading the body are raised as retriable, for the request to be sent
+        again.
+        """
+        response = self.requests_session.send(
+            prepared_request, timeout=self.timeout, stream=True
+        )
+        self._write_request_duration_log(
+            endpoint=self.path,
+            response=response,
+            context=context,
+            extra_tags={"url": prepared_request.path_url}
+            if self._LOG_REQUEST_METRIC_URLS
+            else None,
+        )
+        try:
+            self.validate_response(response)
+        except Exception:
+            # Release the connection back to the pool before retrying
+            response.close()
+            raise
+        if not self._is_large_response(response):
+            # Accessing `content` reads and caches the whole body
+            response.content
+            return response
+        response.raw.decode_content = True
+        try:
+            with response:
+                ticket = next(ijson.items(response.raw, "", use_float=True))
+        except (urllib3.exceptions.HTTPError, ijson.JSONError) as ex:
+            raise RetriableAPIError(
+                f"Failed reading the body of {prepared_request.path_url}: {ex}"
+            ) from ex
+        return DecodedResponse.from_response(response, ticket)
 
     def get_url_params(
         self, context: Optional[dict], next_page_token: Optional[Any]
     ) -> Dict[str, Any]:
         """Override parent URL params with no paging as we only grab a single ticket here."""
-        return {}
+        return cast(Dict[str, Any], NO_URL_PARAMS)
+
+    def get_next_page_token(
+        self, response: requests.Response, previous_token: Optional[Any]
+    ) -> Any:
+        """Return None as there is a single page, without reading the response body."""
+        return None
     
     def parse_response(self, response: requests.Response) -> Iterable[dict]:
         """
@@ -402,32 +426,32 @@ class TicketDetailsStream(GorgiasStream):
 
         Yields: One item for every item found in the response.
         """
-        resp = response.json()
-        for key in list(resp["customer"]["integrations"].keys()):
-            if resp["customer"]["integrations"][key]["__integration_type__"] == "shopify":
-                resp["customer"]["integrations"]["shopify"] = resp["customer"]["integrations"].pop(key)
-                resp["customer"]["integrations"]["shopify"]["id"] = key
+        if isinstance(response, DecodedResponse):
+            resp = response.decoded_body
+        else:
+            resp = orjson.loads(response.content)
+        integrations = resp["customer"]["integrations"]
+        shopify = integrations.get("shopify")
+        if (
+            shopify
+            and shopify.get("__integration_type__") == "shopify"
+            and "id" in shopify
+        ):
+            # Already returned under the canonical key, with its id
+            yield resp
+            return
+        for key, integration in integrations.items():
+            if integration.get("__integration_type__") == "shopify":
+                integration["id"] = key
+                integrations["shopify"] = integration
+                if key != "shopify":
+                    del integrations[key]
+                # Stop right away, the dict was just modified
+                break
         yield resp
 
-    def post_process(self, row: dict, context: Optional[dict] = None) -> Optional[dict]:
-        """
-        Remove the ticket and related messages html as it messes up json serialization.
-        We can load these via the Messages stream if needed.
-        """
-        row.pop("body_text", None)
-        row.pop("body_html", None)
-        row.pop("stripped_text", None)
-        row.pop("stripped_html", None)
-
-        for message in row["messages"]:
-            message.pop("body_text", None)
-            message.pop("body_html", None)
-            message.pop("stripped_text", None)
-            message.pop("stripped_html", None)
-        return row
-
 
-class MessagesStream(GorgiasStream):
+class MessagesStream(ConcurrentChildStream):
     """Messages stream.
 
     Uses tickets as a parent stream. Consequently, only retrieves
@@ -442,111 +466,10 @@ class MessagesStream(GorgiasStream):
     primary_keys = ["id"]
     state_partitioning_keys = []
 
-    schema = th.PropertiesList(
-        th.Property(
-            "id",
-            th.IntegerType,
-        ),
-        th.Property(
-            "uri",
-            th.StringType,
-        ),
-        th.Property(
-            "message_id",
-            th.StringType,
-        ),
-        th.Property(
-            "ticket_id",
-            th.IntegerType,
-        ),
-        th.Property(
-            "external_id",
-            th.StringType,
-        ),
-        th.Property("public", th.BooleanType),
-        th.Property(
-            "channel",
-            th.StringType,
-        ),
-        th.Property(
-            "via",
-            th.StringType,
-        ),
-        th.Property(
-            "source",
-            th.ObjectType(
-                th.Property("type", th.StringType),
-                th.Property(
-                    "to",
-                    th.ArrayType(
-                        th.ObjectType(
-                            th.Property("name", th.StringType),
-                            th.Property("address", th.StringType),
-                        )
-                    ),
-                ),
-                th.Property(
-                    "from",
-                    th.ObjectType(
-                        th.Property("name", th.StringType),
-                        th.Property("address", th.StringType),
-                    ),
-                ),
-            ),
-        ),
-        th.Property("sender", *CUSTOMER_SCHEMA),
-        th.Property(
-            "integration_id",
-            th.IntegerType,
-        ),
-        th.Property(
-            "rule_id",
-            th.IntegerType,
-        ),
-        th.Property("from_agent", th.BooleanType),
-        th.Property("receiver", *CUSTOMER_SCHEMA),
-        th.Property(
-            "subject",
-            th.StringType,
-        ),
-        th.Property(
-            "body_text",
-            th.StringType,
-        ),
-        th.Property(
-            "body_html",
-            th.StringType,
-        ),
-        th.Property(
-            "stripped_text",
-            th.StringType,
-        ),
-        th.Property(
-            "stripped_html",
-            th.StringType,
-        ),
-        th.Property(
-            "stripped_signature",
-            th.StringType,
-        ),
-        # th.Property(
-        #     "actions",
-        #     th.ArrayType(
-        #         th.ObjectType()
-        #     ),
-        # ),
-        th.Property(
-            "created_datetime",
-            th.DateTimeType,
-        ),
-        th.Property("sent_datetime", th.DateTimeType),
-        th.Property("failed_datetime", th.DateTimeType),
-        th.Property("deleted_datetime", th.DateTimeType),
-        th.Property("opened_datetime", th.DateTimeType),
-    ).to_dict()
-
-
-class SatisfactionSurveysStream(GorgiasStream):
+    schema = _schemas.MESSAGES
+
+
+class SatisfactionSurveysStream(CachedPagesStream):
     """Satisfaction surveys.
 
     The satisfaction survey API endpoint does not allow any filtering or
@@ -563,21 +486,10 @@ class SatisfactionSurveysStream(GorgiasStream):
     path = "/api/satisfaction-surveys"
 
     primary_keys = ["id"]
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("body_text", th.StringType),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property("customer_id", th.IntegerType),
-        th.Property("score", th.IntegerType),
-        th.Property("scored_datetime", th.DateTimeType),
-        th.Property("sent_datetime", th.DateTimeType),
-        th.Property("should_send_datetime", th.DateTimeType),
-        th.Property("ticket_id", th.IntegerType),
-        th.Property("uri", th.StringType),
-    ).to_dict()
-
-
-class CustomersStream(GorgiasStream):
+    schema = _schemas.SATISFACTION_SURVEYS
+
+
+class CustomersStream(CachedPagesStream):
     """Customers.
 
     The customers API endpoint does not allow any filtering or
@@ -591,27 +503,7 @@ class CustomersStream(GorgiasStream):
     path = "/api/customers"
     primary_keys = ["id"]
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property("email", th.StringType),
-        th.Property("external_id", th.StringType),
-        th.Property("firstname", th.StringType),
-        th.Property("language", th.StringType),
-        th.Property("lastname", th.StringType),
-        th.Property("name", th.StringType),
-        th.Property("timezone", th.StringType),
-        th.Property("updated_datetime", th.DateTimeType),
-        th.Property("note", th.StringType),
-        th.Property("active", th.BooleanType),
-        th.Property(
-            "meta",
-            th.ObjectType(
-                th.Property("name_set_via", th.StringType),
-            ),
-        ),
-        th.Property("error", th.StringType),
-    ).to_dict()
+    schema = _schemas.CUSTOMERS
 
 
 class IntegreationsStream(GorgiasStream):
@@ -622,35 +514,7 @@ class IntegreationsStream(GorgiasStream):
     # Link to the next items, if any.
     next_page_token_jsonpath = "$.meta.next_items"
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("uri", th.StringType),
-        th.Property(
-            "user",
-            th.ObjectType(th.Property("id", th.IntegerType)),
-        ),
-        th.Property("type", th.StringType),
-        th.Property("name", th.StringType),
-        th.Property("description", th.StringType),
-        th.Property(
-            "meta",
-            th.ObjectType(
-                th.Property("shop_name", th.StringType),
-                th.Property("shop_display_name", th.StringType),
-                th.Property("shop_domain", th.StringType),
-                th.Property("shop_plan", th.StringType),
-                th.Property("shop_id", th.IntegerType),
-                th.Property("shopify_integration_ids", th.ArrayType(th.IntegerType)),
-                th.Property("shopify_integration_id", th.IntegerType),
-                th.Property("shop_integration_id", th.IntegerType),
-            ),
-        ),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property("updated_datetime", th.DateTimeType),
-        th.Property("deactivated_datetime", th.DateTimeType),
-        th.Property("locked_datetime", th.DateTimeType),
-        th.Property("deleted_datetime", th.DateTimeType),
-    ).to_dict()
+    schema = _schemas.INTEGRATIONS
 
 
 class MacrosStream(GorgiasStream):
@@ -658,28 +522,4 @@ class MacrosStream(GorgiasStream):
     path = "/api/macros"
     primary_keys = ["id"]
 
-    schema = th.PropertiesList(
-        th.Property("id", th.IntegerType),
-        th.Property("external_id", th.StringType),
-        th.Property("name", th.StringType),
-        th.Property("intent", th.StringType),
-        th.Property("language", th.StringType),
-        th.Property("usage", th.IntegerType),
-        th.Property("actions", th.ArrayType(
-            th.ObjectType(
-                th.Property("arguments", th.ObjectType(
-                    th.Property("body_html", th.StringType),
-                    th.Property("body_text", th.StringType),
-                    th.Property("tags", th.StringType),
-                    additional_properties=True,
-                )),
-                th.Property("description", th.StringType),
-                th.Property("name", th.StringType),
-                th.Property("title", th.StringType),
-                th.Property("type", th.StringType),
-            )
-        )),
-        th.Property("created_datetime", th.DateTimeType),
-        th.Property("updated_datetime", th.DateTimeType),
-        th.Property("uri", th.StringType),
-    ).to_dict()
\ No newline at end of file
+    schema = _schemas.MACROS
\ No newline at end of file
@@ -79,6 +79,24 @@ class TapGorgias(Tap):
             default=[],
             description="Optional list of user IDs to additionally share the tickets view with",
         ),
+        th.Property(
+            "ticket_details_statuses",
+            th.ArrayType(th.StringType),
+            description=(
+                "Optional list of ticket statuses to request ticket details for. "
+                "Details of tickets with other statuses are built from the tickets "
+                "list instead, without the fields it lacks like `events` and `spam`"
+            ),
+        ),
+        th.Property(
+            "etag_cache_path",
+            th.StringType,
+            description=(
+                "Optional path to a SQLite file caching the pages of the customers "
+                "and satisfaction surveys streams, which are only re-downloaded "
+                "when they changed since the previous sync"
+            ),
+        ),
     ).to_dict()
 
     def discover_streams(self) -> List[Stream]:
@@ -0,0 +1,127 @@
+"""Tests the page cache of the full refresh streams."""
+
+import json
+import sqlite3
+
+import pytest
+import requests
+from singer_sdk.exceptions import FatalAPIError
+
+from tap_gorgias.streams import CustomersStream
+from tap_gorgias.tap import TapGorgias
+
+SAMPLE_CONFIG = {
+    "subdomain": "example",
+    "email_address": "user@example.com",
+    "api_key": "key",
+}
+
+FIRST_PAGE_URL = "https://example.gorgias.com/api/customers?limit=100"
+SECOND_PAGE_URL = "https://example.gorgias.com/api/customers?cursor=p2&limit=100"
+
+
+class FakeApi:
+    """Answer the customers pages, honouring `If-None-Match`."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.requests = []
+
+    def send(self, prepared_request, **kwargs):
+        self.requests.append(
+            (prepared_request.url, prepared_request.headers.get("If-None-Match"))
+        )
+        body = self.pages[prepared_request.url]
+        etag = f'"{hash(body)}"'
+        response = requests.Response()
+        response.request = prepared_request
+        response.url = prepared_request.url
+        response.headers["ETag"] = etag
+        if prepared_request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = body
+        return response
+
+
+def make_pages(*cursors):
+    """Return customers pages, chained through the given cursors."""
+    pages = {}
+    urls = (FIRST_PAGE_URL, SECOND_PAGE_URL)
+    for page, (url, cursor) in enumerate(zip(urls, cursors)):
+        pages[url] = json.dumps(
+            {"data": [{"id": page + 1}], "meta": {"next_cursor": cursor}}
+        ).encode()
+    return pages
+
+
+def sync(cache_path, send):
+    """Return the ids of the customers synced through `send`."""
+    tap = TapGorgias(config={**SAMPLE_CONFIG, "etag_cache_path": str(cache_path)})
+    stream = CustomersStream(tap=tap)
+    stream.requests_session.send = send
+    return [record["id"] for record in stream.get_records(None)]
+
+
+def cached_urls(cache_path):
+    connection = sqlite3.connect(cache_path)
+    try:
+        return {url for (url,) in connection.execute("SELECT url FROM pages")}
+    finally:
+        connection.close()
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return tmp_path / "cache.sqlite"
+
+
+def test_unmodified_pages_are_served_from_the_cache(cache_path):
+    api = FakeApi(make_pages("p2", None))
+    assert sync(cache_path, api.send) == [1, 2]
+    api.requests.clear()
+
+    assert sync(cache_path, api.send) == [1, 2]
+    assert all(etag is not None for _, etag in api.requests)
+    assert cached_urls(cache_path) == {FIRST_PAGE_URL, SECOND_PAGE_URL}
+
+
+def test_pages_no_longer_requested_are_pruned(cache_path):
+    sync(cache_path, FakeApi(make_pages("p2", None)).send)
+
+    assert sync(cache_path, FakeApi(make_pages(None)).send) == [1]
+    assert cached_urls(cache_path) == {FIRST_PAGE_URL}
+
+
+def test_not_modified_page_missing_from_the_cache_is_requested_again(cache_path):
+    api = FakeApi(make_pages(None))
+    sync(cache_path, api.send)
+    api.requests.clear()
+
+    def send_after_dropping_the_page(prepared_request, **kwargs):
+        # The page leaves the cache after its request was made conditional
+        if not api.requests:
+            connection = sqlite3.connect(cache_path)
+            with connection:
+                connection.execute("DELETE FROM pages")
+            connection.close()
+        return api.send(prepared_request, **kwargs)
+
+    assert sync(cache_path, send_after_dropping_the_page) == [1]
+    assert [etag is None for _, etag in api.requests] == [False, True]
+    assert cached_urls(cache_path) == {FIRST_PAGE_URL}
+
+
+def test_not_modified_page_never_cached_raises_a_clear_error(cache_path):
+    api = FakeApi(make_pages(None))
+
+    def send_not_modified(prepared_request, **kwargs):
+        response = api.send(prepared_request, **kwargs)
+        response.status_code = 304
+        return response
+
+    with pytest.raises(FatalAPIError, match="missing from the cache"):
+        sync(cache_path, send_not_modified)
+    assert [etag for _, etag in api.requests] == [None, None]
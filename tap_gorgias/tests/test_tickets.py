@@ -0,0 +1,283 @@
+"""Tests the tickets stream and its child streams, against a fake API."""
+
+import gzip
+import io
+import json
+import logging
+import re
+import threading
+from contextlib import redirect_stdout
+
+import brotli
+import pytest
+import requests
+import urllib3
+from requests.structures import CaseInsensitiveDict
+from singer_sdk.exceptions import FatalAPIError, RetriableAPIError
+
+from tap_gorgias.streams import DecodedResponse, MessagesStream, TicketDetailsStream
+from tap_gorgias.tap import TapGorgias
+
+SAMPLE_CONFIG = {
+    "subdomain": "example",
+    "email_address": "user@example.com",
+    "api_key": "key",
+    "start_date": "2020-01-01T00:00:00Z",
+    "page_size": 25,
+}
+
+VIEW_ID = 7
+
+
+def make_ticket(ticket_id):
+    """Return a ticket as listed in the tickets view."""
+    return {
+        "id": ticket_id,
+        "status": "open" if ticket_id % 2 else "closed",
+        "subject": f"Ticket {ticket_id}",
+        "updated_datetime": f"2024-01-01T00:00:{ticket_id:02d}",
+        "customer": {"id": 1, "email": "customer@example.com", "name": "Customer"},
+        "assignee_user": {"id": 2, "email": "agent@example.com", "name": "Agent"},
+        "tags": [{"id": 3, "name": "tag"}],
+    }
+
+
+def make_details(ticket_id):
+    """Return the details of a ticket, as requested by id."""
+    return {
+        **make_ticket(ticket_id),
+        "spam": False,
+        "customer": {
+            "id": 1,
+            "email": "customer@example.com",
+            "integrations": {"55": {"__integration_type__": "shopify"}},
+        },
+        "messages": [{"id": ticket_id * 10, "body_html": "<p>Hello</p>"}],
+    }
+
+
+class FakeApi:
+    """Answer the requests of the tickets stream and its child streams."""
+
+    def __init__(self, ticket_count, message_pages=1):
+        self.tickets = [make_ticket(i) for i in range(1, ticket_count + 1)]
+        self.message_pages = message_pages
+        self.requests = []
+
+    def send(self, prepared_request, **kwargs):
+        path, _, query = prepared_request.path_url.partition("?")
+        self.requests.append((prepared_request.method, path))
+        status_code, body = self.route(prepared_request.method, path, query)
+        response = requests.Response()
+        response.request = prepared_request
+        response.url = prepared_request.url
+        response.status_code = status_code
+        response.raw = io.BytesIO(json.dumps(body).encode())
+        return response
+
+    def route(self, method, path, query):
+        cursor = re.search(r"cursor=(\d+)", query)
+        page = int(cursor.group(1)) if cursor else 0
+        if path == "/api/users/0":
+            return 200, {"id": 3}
+        if path == "/api/views":
+            return 200, {"id": VIEW_ID}
+        if method == "DELETE":
+            return 200, {}
+        if path == f"/api/views/{VIEW_ID}/items":
+            start = page * SAMPLE_CONFIG["page_size"]
+            end = start + SAMPLE_CONFIG["page_size"]
+            more = end < len(self.tickets)
+            tickets = self.tickets[start:end]
+            next_items = f"cursor={page + 1}&ignored_item=x" if more else None
+            return 200, {"data": tickets, "meta": {"next_items": next_items}}
+        match = re.fullmatch(r"/api/tickets/(\d+)(/messages)?", path)
+        if match is None or int(match.group(1)) > len(self.tickets):
+            return 404, {"error": "Not found"}
+        ticket_id = int(match.group(1))
+        if not match.group(2):
+            return 200, make_details(ticket_id)
+        more = page + 1 < self.message_pages
+        message = {"id": ticket_id * 100 + page, "ticket_id": ticket_id}
+        next_cursor = page + 1 if more else None
+        return 200, {"data": [message], "meta": {"next_cursor": next_cursor}}
+
+
+@pytest.fixture
+def fake_api(monkeypatch):
+    api = FakeApi(33)
+    monkeypatch.setattr(
+        requests.Session, "send", lambda _, *args, **kwargs: api.send(*args, **kwargs)
+    )
+    return api
+
+
+def select_streams(catalog, stream_names, deselected=()):
+    """Select only the given streams, without the deselected breadcrumbs."""
+    for stream in catalog["streams"]:
+        for entry in stream["metadata"]:
+            if not entry["breadcrumb"]:
+                entry["metadata"]["selected"] = stream["tap_stream_id"] in stream_names
+        stream["metadata"] += [
+            {"breadcrumb": list(breadcrumb), "metadata": {"selected": False}}
+            for stream_name, breadcrumb in deselected
+            if stream_name == stream["tap_stream_id"]
+        ]
+    return catalog
+
+
+def sync(config, stream_names, deselected=()):
+    """Sync the streams and return their records, by stream."""
+    catalog = TapGorgias(config=config).catalog_dict
+    tap = TapGorgias(
+        config=config, catalog=select_streams(catalog, stream_names, deselected)
+    )
+    stdout = io.StringIO()
+    with redirect_stdout(stdout):
+        tap.sync_all()
+    records = {}
+    for line in stdout.getvalue().splitlines():
+        message = json.loads(line)
+        if message["type"] == "RECORD":
+            records.setdefault(message["stream"], []).append(message["record"])
+    return records
+
+
+def test_listed_ticket_details_do_not_change_the_tickets_records(fake_api):
+    customer_email = ("properties", "customer", "properties", "email")
+    records = sync(
+        {**SAMPLE_CONFIG, "ticket_details_statuses": ["open"]},
+        ["tickets", "ticket_details"],
+        deselected=[("ticket_details", customer_email)],
+    )
+
+    assert [ticket["id"] for ticket in records["tickets"]] == list(range(1, 34))
+    for ticket in records["tickets"]:
+        assert ticket["customer"]["email"] == "customer@example.com"
+    assert len(records["ticket_details"]) == 33
+    for details in records["ticket_details"]:
+        assert "email" not in details["customer"]
+
+
+def test_worker_errors_are_raised_in_the_syncing_thread(fake_api):
+    stream = MessagesStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+
+    with pytest.raises(FatalAPIError, match="404"):
+        list(stream.get_records({"ticket_ids": [1, 2, 404]}))
+
+
+def test_closing_the_records_early_releases_the_workers(fake_api):
+    stream = MessagesStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+    stream.queue_size = 1
+    records = stream.get_records({"ticket_ids": list(range(1, 33))})
+    next(records)
+
+    # Workers blocked on the full queue would keep the thread pool from exiting
+    closing = threading.Thread(target=records.close, daemon=True)
+    closing.start()
+    closing.join(timeout=5)
+    assert not closing.is_alive()
+
+
+def test_every_page_of_the_messages_is_fetched(fake_api):
+    fake_api.message_pages = 3
+    stream = MessagesStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+
+    records = stream.get_records({"ticket_ids": [1, 2]})
+
+    assert sorted(record["id"] for record in records) == [100, 101, 102, 200, 201, 202]
+
+
+def test_last_partial_batch_is_synced(fake_api):
+    records = sync(SAMPLE_CONFIG, ["tickets", "messages"])
+
+    assert len(records["tickets"]) == 33
+    assert sorted(message["ticket_id"] for message in records["messages"]) == list(
+        range(1, 34)
+    )
+
+
+def test_concurrent_requests_are_counted(fake_api, caplog):
+    stream = MessagesStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+
+    # The metrics logger does not propagate to the root logger
+    metrics_logger = logging.getLogger("singer_sdk.metrics")
+    metrics_logger.addHandler(caplog.handler)
+    try:
+        list(stream.get_records({"ticket_ids": [1, 2, 3]}))
+    finally:
+        metrics_logger.removeHandler(caplog.handler)
+
+    request_counts = [
+        json.loads(record.getMessage().partition("METRIC: ")[2])
+        for record in caplog.records
+        if '"metric": "http_request_count"' in record.getMessage()
+    ]
+    assert [count["value"] for count in request_counts] == [3]
+    assert request_counts[0]["tags"]["stream"] == "messages"
+
+
+def send_streamed(body, headers):
+    """Return a `send` answering a body left on a streamed raw response."""
+
+    def send(prepared_request, **kwargs):
+        response = requests.Response()
+        response.request = prepared_request
+        response.url = prepared_request.url
+        response.status_code = 200
+        response.headers = CaseInsensitiveDict(headers)
+        response.raw = urllib3.HTTPResponse(
+            body=io.BytesIO(body),
+            headers=headers,
+            status=200,
+            preload_content=False,
+            decode_content=False,
+        )
+        return response
+
+    return send
+
+
+def large_details():
+    """Return the details of a ticket larger than the streaming threshold."""
+    details = make_details(1)
+    details["customer"]["integrations"]["55"]["total_price"] = 12.5
+    details["messages"][0]["body_html"] = "x" * (300 * 1024)
+    return json.dumps(details).encode()
+
+
+@pytest.mark.parametrize(
+    "encoding,encode",
+    [(None, lambda body: body), ("gzip", gzip.compress), ("br", brotli.compress)],
+)
+@pytest.mark.parametrize("with_length", [True, False])
+def test_large_ticket_details_are_decoded_while_read(encoding, encode, with_length):
+    body = encode(large_details())
+    headers = {"Content-Encoding": encoding} if encoding else {}
+    if with_length:
+        headers["Content-Length"] = str(len(body))
+    stream = TicketDetailsStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+    stream.requests_session.send = send_streamed(body, headers)
+    prepared_request = stream.prepare_request({"ticket_id": 1}, None)
+
+    response = stream._request(prepared_request, {"ticket_id": 1})
+    (details,) = stream.parse_response(response)
+
+    # Compressed bodies sent with their length are below the threshold
+    streamed = not (with_length and encoding)
+    assert isinstance(response, DecodedResponse) is streamed
+    shopify = details["customer"]["integrations"]["shopify"]
+    assert shopify["id"] == "55"
+    assert shopify["total_price"] == 12.5
+    assert isinstance(shopify["total_price"], float)
+
+
+def test_truncated_ticket_details_are_retriable():
+    body = large_details()
+    headers = {"Content-Length": str(len(body))}
+    stream = TicketDetailsStream(tap=TapGorgias(config=SAMPLE_CONFIG))
+    stream.requests_session.send = send_streamed(body[: len(body) // 2], headers)
+    prepared_request = stream.prepare_request({"ticket_id": 1}, None)
+
+    with pytest.raises(RetriableAPIError, match="/api/tickets/1"):
+        stream._request(prepared_request, {"ticket_id": 1})